@@ -1,20 +1,26 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import partial
 
 from .mixins import ToDictMixin
 
 
+_utcnow = partial(datetime.now, timezone.utc)
+
+
 def _now_iso() -> str:
     """
     Return the current moment in ISO 8601 format with UTC timezone.
 
+    Reads the clock through module-level `_utcnow` so tests can replace it.
+
     Example: '2025-10-09T12:34:56.789012+00:00'
     """
-    return datetime.now(timezone.utc).isoformat()
+    return _utcnow().isoformat()
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, weakref_slot=True)
 class ErrorFields:
     """
     Base class for HTTP-level errors with dictionary serialization.
@@ -49,7 +55,7 @@ class ErrorFields:
     traceback: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Error(ErrorFields, ToDictMixin):
     """
     Concrete domain error DTO that combines the data-only fields (`ErrorFields`)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import is_dataclass, fields, dataclass
-from typing import Dict, Any
+from dataclasses import fields, dataclass
+from functools import lru_cache
+from typing import Dict, Any, Tuple
 
 
 def _compact_dict(d: Dict[str, Any]) -> Dict[str, Any]:
@@ -14,6 +15,17 @@ def _compact_dict(d: Dict[str, Any]) -> Dict[str, Any]:
     return {k: v for k, v in d.items() if v is not None}
 
 
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """
+    Return the dataclass field names of `cls`, computed once per class.
+
+    Raises:
+        TypeError: If `cls` is not a dataclass (failures are not cached).
+    """
+    return tuple(f.name for f in fields(cls))
+
+
 class ToDictMixin:
     """
     Reusable mixin that serializes a dataclass instance to a plain dictionary.
@@ -26,6 +38,10 @@ class ToDictMixin:
         - Works only with dataclass *instances*; otherwise a TypeError is raised.
         - This is a shallow (top-level) serialization. Nested objects are
           returned as-is unless they are already plain types.
+        - Values are not copied or converted. Tuple fields (e.g. `Err422.loc`)
+          stay tuples; both `json.dumps` and `orjson.dumps` encode them as
+          arrays, so payloads built only from plain types can be passed to
+          either encoder directly.
 
     Example:
         @dataclass
@@ -38,6 +54,8 @@ class ToDictMixin:
         User(1, "Alice", None).to_dict()          # {'id': 1, 'name': 'Alice'}
         User(1, "Alice", None).to_dict(False)     # {'id': 1, 'name': 'Alice', 'email': None}
     """
+    __slots__ = ()
+
     def to_dict(self: dataclass, *, exclude_none: bool = True) -> Dict[str, Any]:
         """
         Convert the dataclass instance into a dictionary.
@@ -52,10 +70,17 @@ class ToDictMixin:
         Raises:
             TypeError: If called on a non-dataclass instance.
         """
-        if not is_dataclass(self):
+        try:
+            names = _field_names(type(self))
+        except TypeError:
             raise TypeError(
                 f"ToDictMixin awaits dataclass but got {type(self).__name__}"
-            )
+            ) from None
 
-        base = {f.name: getattr(self, f.name) for f in fields(self)}
-        return _compact_dict(base) if exclude_none else base
+        if exclude_none:
+            return {
+                name: value
+                for name in names
+                if (value := getattr(self, name)) is not None
+            }
+        return {name: getattr(self, name) for name in names}
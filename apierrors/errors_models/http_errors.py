@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import TypeVar, Generic, Mapping, List
 
 from .base import Error
@@ -6,7 +6,7 @@ from .base import Error
 
 E_co = TypeVar("E_co", bound=Error, covariant=True)
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, eq=False)
 class HttpErrorEnvelope(Generic[E_co]):
     """Transport-agnostic error envelope.
 
@@ -40,5 +40,5 @@ class HttpErrorEnvelope(Generic[E_co]):
         >>> HttpErrorEnvelope[Error](status_code=500)
     """
     status_code: int
-    detail: list[E_co] = field(default_factory=list)
+    detail: tuple[E_co, ...] = ()
     headers: Mapping[str, str] | None = None
@@ -5,7 +5,7 @@ from ...errors_models import HttpErrorEnvelope, Error
 
 
 @final
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Err400(Error):
     """Domain error representing an HTTP 400 Bad Request."""
 
@@ -14,7 +14,7 @@ class Err400(Error):
 
 
 @final
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, eq=False)
 class HttpErr400BadRequest(HttpErrorEnvelope[Err400]):
     """HTTP 400 Bad Request envelope.
 
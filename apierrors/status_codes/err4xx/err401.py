@@ -5,7 +5,7 @@ from ...errors_models import HttpErrorEnvelope, Error
 
 
 @final
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Err401(Error):
     """
     Ошибка аутентификации.
@@ -26,7 +26,7 @@ class Err401(Error):
 
 
 @final
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, eq=False)
 class HttpErr401Unauthorized(HttpErrorEnvelope[Err401]):
     """HTTP 401 Unauthorized envelope (status_code фиксирован)."""
 
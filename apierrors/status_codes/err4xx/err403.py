@@ -5,7 +5,7 @@ from ...errors_models import HttpErrorEnvelope, Error
 
 
 @final
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Err403(Error):
     """
     Ошибка авторизации/прав доступа.
@@ -26,7 +26,7 @@ class Err403(Error):
 
 
 @final
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, eq=False)
 class HttpErr403Forbidden(HttpErrorEnvelope[Err403]):
     """HTTP 403 Forbidden envelope (status_code фиксирован)."""
     status_code: int = field(default=403, init=False)
\ No newline at end of file
@@ -4,7 +4,7 @@ from typing import final
 from ...errors_models import HttpErrorEnvelope, Error
 
 @final
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Err404(Error):
     """
     Ресурс не найден.
@@ -22,7 +22,7 @@ class Err404(Error):
 
 
 @final
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, eq=False)
 class HttpErr404NotFound(HttpErrorEnvelope[Err404]):
     """HTTP 404 Not Found envelope (status_code фиксирован)."""
     status_code: int = field(default=404, init=False)
\ No newline at end of file
@@ -4,7 +4,7 @@ from typing import final, Sequence
 from ...errors_models import HttpErrorEnvelope, Error
 
 @final
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Err405(Error):
     """
     Метод не поддерживается для ресурса.
@@ -19,7 +19,7 @@ class Err405(Error):
 
 
 @final
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, eq=False)
 class HttpErr405MethodNotAllowed(HttpErrorEnvelope[Err405]):
     """
     HTTP 405 Method Not Allowed envelope.
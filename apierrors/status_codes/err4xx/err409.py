@@ -5,7 +5,7 @@ from ...errors_models import HttpErrorEnvelope, Error
 
 
 @final
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Err409(Error):
     """
     Конфликт состояния/версии ресурса.
@@ -27,7 +27,7 @@ class Err409(Error):
 
 
 @final
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, eq=False)
 class HttpErr409Conflict(HttpErrorEnvelope[Err409]):
     """HTTP 409 Conflict envelope (status_code фиксирован)."""
     status_code: int = field(default=409, init=False)
\ No newline at end of file
@@ -4,7 +4,7 @@ from ...errors_models import HttpErrorEnvelope, Error
 
 
 @final
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Err422(Error):
     """
     Валидационная ошибка, совместимая по форме с FastAPI.
@@ -25,7 +25,7 @@ class Err422(Error):
 
 
 @final
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, eq=False)
 class HttpErr422UnprocessableEntity(HttpErrorEnvelope[Err422]):
     """HTTP 422 Unprocessable Entity envelope (status_code фиксирован)."""
 
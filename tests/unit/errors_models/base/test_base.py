@@ -1,19 +1,26 @@
+import weakref
 from dataclasses import is_dataclass
-from time import sleep
+from types import MappingProxyType
 
 import pytest
 from datetime import datetime, timezone
 
+from apierrors.errors_models.base import base
 from apierrors.errors_models.base.base import ErrorFields, Error
 
 
-@pytest.fixture
+_fromiso = datetime.fromisoformat
+
+
+@pytest.fixture(scope="module")
 def minimal_kwargs():
-    """Provide minimal required kwargs for HttpErrorFields."""
-    return dict(
-        code="bad_request",
-        error_type="BadRequest",
-        message="Something went wrong",
+    """Provide minimal required kwargs for HttpErrorFields (read-only, shared per module)."""
+    return MappingProxyType(
+        dict(
+            code="bad_request",
+            error_type="BadRequest",
+            message="Something went wrong",
+        )
     )
 
 
@@ -52,18 +59,25 @@ def test_timestamp_autofill_iso_utc(minimal_kwargs):
     """
     obj = ErrorFields(**minimal_kwargs)
     assert isinstance(obj.timestamp, str)
-    dt = datetime.fromisoformat(obj.timestamp)
+    dt = _fromiso(obj.timestamp)
     assert isinstance(dt, datetime)
     assert dt.tzinfo is not None
     assert dt.tzinfo.utcoffset(dt) == timezone.utc.utcoffset(dt)
 
 
-def test_timestamp_differs_between_instances(minimal_kwargs):
-    """Auto-generated timestamps should differ for separate instances (very likely)."""
+def test_timestamp_differs_between_instances(minimal_kwargs, monkeypatch):
+    """Each instance reads the clock on its own; timestamps are not shared."""
+    ticks = iter(
+        (
+            datetime(2025, 1, 1, tzinfo=timezone.utc),
+            datetime(2025, 1, 1, microsecond=1, tzinfo=timezone.utc),
+        )
+    )
+    monkeypatch.setattr(base, "_utcnow", ticks.__next__)
     obj1 = ErrorFields(**minimal_kwargs)
-    sleep(0.01)
     obj2 = ErrorFields(**minimal_kwargs)
-    assert obj1.timestamp != obj2.timestamp
+    assert obj1.timestamp == "2025-01-01T00:00:00+00:00"
+    assert obj2.timestamp == "2025-01-01T00:00:00.000001+00:00"
 
 
 def test_timestamp_can_be_overridden(minimal_kwargs):
@@ -71,7 +85,7 @@ def test_timestamp_can_be_overridden(minimal_kwargs):
     ts = "2025-10-09T12:34:56.789012+00:00"
     obj = ErrorFields(**minimal_kwargs, timestamp=ts)
     assert obj.timestamp == ts
-    dt = datetime.fromisoformat(obj.timestamp)
+    dt = _fromiso(obj.timestamp)
     assert dt.tzinfo is not None
     assert dt.tzinfo.utcoffset(dt) == timezone.utc.utcoffset(dt)
 
@@ -128,4 +142,19 @@ def test_error_to_dict_returns_mapping_smoke(minimal_kwargs):
     """
     obj = Error(**minimal_kwargs)
     d = obj.to_dict()
-    assert isinstance(d, dict)
\ No newline at end of file
+    assert isinstance(d, dict)
+
+
+def test_error_instances_are_slotted(minimal_kwargs):
+    """`Error` stores its fields in slots and carries no per-instance `__dict__`."""
+    obj = Error(**minimal_kwargs)
+    assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        obj.unknown = 1
+
+
+def test_error_supports_weak_references(minimal_kwargs):
+    """Slotted `Error` keeps a `__weakref__` slot, so weak references still work."""
+    obj = Error(**minimal_kwargs)
+    ref = weakref.ref(obj)
+    assert ref() is obj
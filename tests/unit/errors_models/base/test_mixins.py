@@ -1,8 +1,10 @@
+import json
 from dataclasses import dataclass
 
 import pytest
 
 from apierrors.errors_models.base.mixins import _compact_dict, ToDictMixin
+from apierrors.status_codes.err4xx.err422 import Err422
 
 
 # --------------------
@@ -10,17 +12,17 @@ from apierrors.errors_models.base.mixins import _compact_dict, ToDictMixin
 # --------------------
 
 
-@pytest.mark.parametrize(
-    "input_dict, expected",
-    [
-        pytest.param({}, {}),
-        pytest.param({"a": 1, "b": 2}, {"a": 1, "b": 2}),
-        pytest.param({"a": None, "b": 2}, {"b": 2}),
-        pytest.param({"a": 0, "b": False, "c": ""}, {"a": 0, "b": False, "c": ""}),
-        pytest.param({"a": None, "b": {"k": None}}, {"b": {"k": None}}),
-        pytest.param({"a": None, "b": [None, 1]}, {"b": [None, 1]}),
-    ],
+_COMPACT_CASES = (
+    ({}, {}),
+    ({"a": 1, "b": 2}, {"a": 1, "b": 2}),
+    ({"a": None, "b": 2}, {"b": 2}),
+    ({"a": 0, "b": False, "c": ""}, {"a": 0, "b": False, "c": ""}),
+    ({"a": None, "b": {"k": None}}, {"b": {"k": None}}),
+    ({"a": None, "b": [None, 1]}, {"b": [None, 1]}),
 )
+
+
+@pytest.mark.parametrize("input_dict, expected", _COMPACT_CASES)
 def test_compact_dict_top_level_only(input_dict, expected):
     """Only drop top-level None values; keep falsy values and nested Nones."""
     assert _compact_dict(input_dict) == expected
@@ -111,3 +113,35 @@ def test_stability_does_not_mutate_instance():
     _ = obj.to_dict()
     after = (obj.a, obj.b, obj.c)
     assert before == after
+
+
+@dataclass
+class ExtendedDC(SimpleDC):
+    d: str = "extra"
+
+
+def test_subclass_fields_are_resolved_per_class():
+    """A dataclass subclass serializes its own fields, not the cached parent set."""
+    assert set(SimpleDC(a=1, b="x").to_dict()) == {"a", "b"}
+    assert set(ExtendedDC(a=1, b="x").to_dict()) == {"a", "b", "d"}
+
+
+@dataclass(slots=True)
+class SlottedDC(ToDictMixin):
+    a: int
+    b: str | None = None
+
+
+def test_mixin_does_not_reintroduce_instance_dict():
+    """ToDictMixin declares empty __slots__, so slotted subclasses stay dict-free."""
+    assert ToDictMixin.__slots__ == ()
+    obj = SlottedDC(a=1)
+    assert not hasattr(obj, "__dict__")
+    assert obj.to_dict() == {"a": 1}
+
+
+def test_tuple_values_are_kept_and_json_encodable():
+    """Tuple fields (Err422.loc) are returned unchanged and still encode as JSON arrays."""
+    d = Err422(message="invalid", loc=("body", "items", 0)).to_dict()
+    assert d["loc"] == ("body", "items", 0)
+    assert json.loads(json.dumps(d))["loc"] == ["body", "items", 0]
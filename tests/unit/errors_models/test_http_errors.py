@@ -8,9 +8,9 @@ from apierrors.errors_models.base import Error
 from apierrors.errors_models import HttpErrorEnvelope
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_error() -> Error:
-    """Provide a minimal valid Error instance."""
+    """Provide a minimal valid Error instance (shared per module; do not mutate)."""
     return Error(code="BAD_REQUEST", error_type="bad_request", message="oops")
 
 
@@ -21,15 +21,15 @@ def test_constructor_is_keyword_only(sample_error: Error):
 
 
 def test_field_types(sample_error: Error):
-    """Runtime typing: status_code=int, detail=list[Error], headers=dict[str,str]|None."""
+    """Runtime typing: status_code=int, detail=tuple[Error, ...], headers=dict[str,str]|None."""
     env = HttpErrorEnvelope(
         status_code=400,
-        detail=[sample_error],
+        detail=(sample_error,),
         headers={"X-Trace": "t-1"},
     )
     assert is_dataclass(env)
     assert isinstance(env.status_code, int)
-    assert isinstance(env.detail, list)
+    assert isinstance(env.detail, tuple)
     assert all(isinstance(e, Error) for e in env.detail)
     assert isinstance(env.headers, dict)
     assert all(
@@ -47,21 +47,34 @@ def test_required_params(sample_error: Error):
 
 
 def test_defaults_values_are_applied():
-    """detail defaults to a new empty list; headers defaults to None."""
+    """detail defaults to an empty tuple; headers defaults to None."""
     env = HttpErrorEnvelope(status_code=400)
-    assert env.detail == []
+    assert env.detail == ()
     assert env.headers is None
 
-    other = HttpErrorEnvelope(status_code=400)
-    env.detail.append(Error(code="C", error_type="t", message="m"))
-    assert other.detail == []
-
 
-def test_detail_smoke_list_of_errors(sample_error: Error):
-    """Smoke: envelope accepts list of Error instances and preserves order."""
+def test_detail_smoke_tuple_of_errors(sample_error: Error):
+    """Smoke: envelope accepts a tuple of Error instances and preserves order."""
     e2 = Error(code="BAD_REQUEST", error_type="bad_request", message="second")
-    env = HttpErrorEnvelope(status_code=400, detail=[sample_error, e2])
+    env = HttpErrorEnvelope(status_code=400, detail=(sample_error, e2))
 
     assert len(env.detail) == 2
     assert env.detail[0].message == "oops"
     assert env.detail[1].message == "second"
+
+
+def test_subscripted_envelope_is_constructible(sample_error: Error):
+    """Calling a parametrized alias must work: typing sets `__orig_class__` on the instance."""
+    env = HttpErrorEnvelope[Error](status_code=400, detail=(sample_error,))
+    assert env.status_code == 400
+    assert env.detail == (sample_error,)
+
+
+def test_envelopes_compare_by_identity():
+    """eq=False: envelopes use identity equality/hash; compare `.detail` for contents."""
+    env = HttpErrorEnvelope(status_code=400)
+    other = HttpErrorEnvelope(status_code=400)
+    assert env == env
+    assert env != other
+    assert env.detail == other.detail
+    assert hash(env) != hash(other)
@@ -0,0 +1,9 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def iso_parse():
+    """Provide the ISO-8601 parser used to validate autofilled timestamps."""
+    from datetime import datetime
+
+    return datetime.fromisoformat
@@ -1,19 +1,27 @@
 from dataclasses import FrozenInstanceError
-from datetime import datetime
 
 import pytest
 
 from apierrors import Err400, HttpErr400BadRequest
 
 
+_OPTIONAL_KEYS = frozenset({"request_id", "path", "method", "traceback"})
+
+_FIELD_DEFAULTS = (
+    ("code", "BAD_REQUEST"),
+    ("error_type", "bad_request"),
+    ("message", "bad"),
+)
+
+
 # --------------------
 # Tests for Err400
 # --------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def err() -> Err400:
-    """Fresh instance per test."""
+    """Shared instance per module; tests only read it."""
     return Err400(message="bad")
 
 
@@ -31,28 +39,26 @@ def test_constructor_is_keyword_only():
         Err400("bad")
 
 
-def test_defaults_of_own_fields(err: Err400):
-    """Status/code are fixed by subclass defaults."""
-    assert err.code == "BAD_REQUEST"
-    assert err.error_type == "bad_request"
+@pytest.mark.parametrize(
+    "attr, expected",
+    _FIELD_DEFAULTS,
+    ids=[attr for attr, _ in _FIELD_DEFAULTS],
+)
+def test_field_defaults(err: Err400, attr: str, expected: str):
+    """Own fields (code/error_type) are fixed by subclass defaults; `message` is what we passed."""
+    assert getattr(err, attr) == expected
 
 
-def test_inherited_fields_presence_and_defaults(err: Err400):
-    """
-    Verify fields coming from the base class:
-      - error_type (default expected as per base/class config)
-      - message (what we passed)
-      - detail/request_id/path/method/traceback (None)
-      - timestamp (ISO-8601, parsable by datetime.fromisoformat)
-    """
-    assert err.message == "bad"
-    assert err.request_id is None
-    assert err.path is None
-    assert err.method is None
-    assert err.traceback is None
+@pytest.mark.parametrize("attr", sorted(_OPTIONAL_KEYS))
+def test_optional_fields_default_to_none(err: Err400, attr: str):
+    """Optional fields inherited from the base class default to None."""
+    assert getattr(err, attr) is None
 
+
+def test_timestamp_is_iso_string(err: Err400, iso_parse):
+    """timestamp is autofilled with an ISO-8601 string parsable by datetime.fromisoformat."""
     assert isinstance(err.timestamp, str)
-    datetime.fromisoformat(err.timestamp)
+    iso_parse(err.timestamp)
 
 
 def test_to_dict_filters_nones_and_merges_extra(err: Err400):
@@ -69,7 +75,7 @@ def test_to_dict_filters_nones_and_merges_extra(err: Err400):
     assert payload["message"] == "bad"
     assert "timestamp" in payload
 
-    for k in ("detail", "request_id", "path", "method", "traceback"):
+    for k in _OPTIONAL_KEYS:
         assert k not in payload
 
 
@@ -87,27 +93,10 @@ def test_optional_fields_show_up_in_payload_when_set():
     assert payload["method"] == "GET"
 
 
-def test_parent_contract_types_exist(err: Err400):
-    """
-    Smoke test: ensure all expected attributes from the contract are present.
-    """
-    for attr in (
-        "code",
-        "error_type",
-        "message",
-        "request_id",
-        "timestamp",
-        "path",
-        "method",
-        "traceback",
-    ):
-        assert hasattr(err, attr)
-
-
 def test_to_dict_include_nones_when_flag_false(err: Err400):
     """exclude_none=False keeps None-valued fields in the payload."""
     payload = err.to_dict(exclude_none=False)
-    for k in ("request_id", "path", "method", "traceback"):
+    for k in _OPTIONAL_KEYS:
         assert k in payload and payload[k] is None
 
 
@@ -151,7 +140,7 @@ def test_400_multiple_errors(err: Err400):
 def test_400_defaults_empty_detail_and_none_headers():
     env = HttpErr400BadRequest()
     assert env.status_code == 400
-    assert env.detail == []
+    assert env.detail == ()
     assert env.headers is None
 
 